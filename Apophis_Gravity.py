@@ -1,110 +1,55 @@
 # Calculating the gravitational force of the Apophis asteroid
-print("-----------------------------------------------------------")
-print("Calculating the gravitational force of the Apophis asteroid")
-
-class GravApop:
-
-# From F = G(M)(m)/d^2 = ma  -->  gApop = G(MApop)/dApop^2
-# ** is exponentiation
-
-# G = Gravitational constant (m^3, kg^-1, s^-2), mass = Mass of Apophis (kg), dist = Radius of Apophis (m)
-
-# Initialization method?
-    def __init__(self,G,mass,dist):
-      self.G = G
-      self.mass = mass
-      self.dist = dist
-      self.gApop = None
-
-
-    def getGrav(self):
-        self.gApop = (self.G * self.mass)/(self.dist)
-
-
-    def printVal(self):
-        print("Gravitational Constant (G): ", self.G)
-        print("Mass: ", self.mass)
-        print("Radius Squared: ", self.dist)
-        print("The Apophis asteroid has a gravitational influence of:\n", self.gApop, "m/s^2")
-
-# values of MApop,dApop,G all in order
-asteroid_1 = GravApop(6.67e-11, 6.1e10, 185**2)
-asteroid_1.getGrav()
-asteroid_1.printVal()
-
-print("-----------------------------------------------------------")
-
-class GravEarth:
-
-    def __init__(self,G,mass,dist):
-      self.G = G
-      self.mass = mass
-      self.dist = dist
-      self.gEarth = None
-
-    def getGrav(self):
-      self.gEarth = (self.G * self.mass)/(self.dist)
-
-
-    def printVal(self):
-      print("Gravitational Constant (G): ", self.G)
-      print("Mass: ", self.mass)
-      print("Radius Squared: ", self.dist)
-      print("The Earth has a gravitational influence of:\n", self.gEarth, "m/s^2")
-
-# values of MApop,dApop,G all in order
-earth1 = GravEarth(6.67e-11, 5.97e24, 6.37e6**2)
-earth1.getGrav()
-earth1.printVal()
-
-
-print("-----------------------------------------------------------")
-
-class GravMoon:
-
-    def __init__(self,G,mass,dist):
-      self.G = G
-      self.mass = mass
-      self.dist = dist
-      self.gEarth = None
-
-    def getGrav(self):
-      self.gMoon = (self.G * self.mass)/(self.dist)
-
-
-    def printVal(self):
-      print("Gravitational Constant (G): ", self.G)
-      print("Mass: ", self.mass)
-      print("Radius Squared: ", self.dist)
-      print("The Moon has a gravitational influence of:\n", self.gMoon, "m/s^2")
-
-# values of MApop,dApop,G all in order
-earth1 = GravMoon(6.67e-11, 7.346e22, 1.74e6**2)
-earth1.getGrav()
-earth1.printVal()
-
-
-print("-----------------------------------------------------------")
-
-class GravSun:
-
-    def __init__(self,G,mass,dist):
-      self.G = G
-      self.mass = mass
-      self.dist = dist
-      self.gEarth = None
-
-    def getGrav(self):
-      self.gSun = (self.G * self.mass)/(self.dist)
-
-
-    def printVal(self):
-      print("Gravitational Constant (G): ", self.G)
-      print("Mass: ", self.mass)
-      print("Radius Squared: ", self.dist)
-      print("The Sun has a gravitational influence of:\n", self.gSun, "m/s^2")
-
-# values of MApop,dApop,G all in order
-earth1 = GravSun(6.67e-11, 1.989e30, 6.96e8**2)
-earth1.getGrav()
-earth1.printVal()
\ No newline at end of file
+import numpy as np
+
+# From F = G(M)(m)/d^2 = ma  -->  g = G(M)/d^2
+# G = Gravitational constant (m^3, kg^-1, s^-2), m = Mass of body (kg), r = Radius (m)
+
+G = 6.67e-11
+
+# One structured array instead of four near-identical classes.
+# Each record: (name, mass, radius) — raw radii now, no pre-squaring
+# at the call site like the old GravApop/GravEarth/GravMoon/GravSun.
+# The rows keep the radii exactly as the old script wrote them (185 was
+# an int literal there), so the report below prints the same values.
+_BODY_ROWS = [
+    ("Apophis asteroid", 6.1e10,   185),
+    ("Earth",            5.97e24,  6.37e6),
+    ("Moon",             7.346e22, 1.74e6),
+    ("Sun",              1.989e30, 6.96e8),
+]
+
+bodies = np.array(_BODY_ROWS, dtype=[('name', 'U16'), ('m', 'f8'), ('r', 'f8')])
+
+def compute_gravity(masses, radii):
+    # Surface gravity g = G*m/r^2 for a whole batch of bodies at once.
+    # Plain ufunc arithmetic — hand it arrays of any matching shape
+    # (or scalars) and NumPy broadcasts and SIMDs the divide.
+    masses = np.asarray(masses, dtype=float)
+    radii = np.asarray(radii, dtype=float)
+    return G * masses / np.square(radii)
+
+
+def main():
+    # Squaring and dividing happen once, vectorized over every body.
+    g = compute_gravity(bodies['m'], bodies['r'])
+
+    print("-----------------------------------------------------------")
+    print("Calculating the gravitational force of the Apophis asteroid")
+
+    for i, (name, mass, gi) in enumerate(zip(bodies['name'], bodies['m'], g)):
+        print("Gravitational Constant (G): ", G)
+        print("Mass: ", mass)
+        # Squared from the original literal so Apophis shows 34225,
+        # not 34225.0, just like the old per-class report did
+        print("Radius Squared: ", _BODY_ROWS[i][2] ** 2)
+        print(f"The {name} has a gravitational influence of:\n", gi, "m/s^2")
+        # separator between bodies only — the old script printed
+        # nothing after the final (Sun) block
+        if i < len(_BODY_ROWS) - 1:
+            print("-----------------------------------------------------------")
+
+
+# Only run the calculation/printing when executed as a script —
+# importing this module just gives you G and the body table for free.
+if __name__ == "__main__":
+    main()
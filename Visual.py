@@ -1,5 +1,6 @@
 import pygame
 import math
+import numpy as np
 
 
 class Visual:
@@ -104,21 +105,23 @@ class Visual:
 
     def draw_orbit_path(self):
         """Draw the elliptical orbit path"""
-        points = []
-        for i in range(len(self.radii)):
-            angle = math.pi * (i / (len(self.radii) - 1))
-            radius = self.radii[i]
-            x = self.sun_x + int(radius * self.scale * math.cos(angle))
-            y = self.sun_y + int(radius * self.scale * math.sin(angle))
-            points.append((x, y))
-
-        # Complete the ellipse by mirroring points
-        for i in range(len(self.radii) - 2, -1, -1):
-            angle = math.pi + math.pi * (1 - i / (len(self.radii) - 1))
-            radius = self.radii[i]
-            x = self.sun_x + int(radius * self.scale * math.cos(angle))
-            y = self.sun_y + int(radius * self.scale * math.sin(angle))
-            points.append((x, y))
+        n = len(self.radii)
+        radii = np.asarray(self.radii)
+
+        # First half: perihelion (0°) to aphelion (180°)
+        angles_fwd = np.pi * (np.arange(n) / (n - 1))
+        # Second half: mirror back from aphelion to perihelion
+        indices_back = np.arange(n - 2, -1, -1)
+        angles_back = np.pi + np.pi * (1 - indices_back / (n - 1))
+
+        # One concatenated angle/radius array, then vectorized cos/sin
+        # instead of per-point math.cos/math.sin calls in Python loops
+        angles = np.concatenate([angles_fwd, angles_back])
+        all_radii = np.concatenate([radii, radii[indices_back]])
+
+        xs = self.sun_x + (all_radii * self.scale * np.cos(angles)).astype(int)
+        ys = self.sun_y + (all_radii * self.scale * np.sin(angles)).astype(int)
+        points = list(zip(xs, ys))
 
         if len(points) > 2:
             pygame.draw.lines(self.screen, self.WHITE, True, points, 1)
@@ -1,79 +1,66 @@
 # Calculating the gravitational force of the Apophis asteroid
-print("-----------------------------------------------------------")
-print("Calculating the gravitational force of the Apophis asteroid")
 
-class GravApop:
-
-# From F = G(M)(m)/d^2 = ma  -->  gApop = G(MApop)/dApop^2
+# From F = G(M)(m)/d^2 = ma  -->  g = G(M)/d^2
 # ** is exponentiation
 
-# G = Gravitational constant (m^3, kg^-1, s^-2), mass = Mass of Apophis (kg), dist = Radius of Apophis (m)
+# G = Gravitational constant (m^3, kg^-1, s^-2), mass = Mass of body (kg), dist = Radius squared (m^2)
 
-# Initialization method?
-    def __init__(self,gConst,mass,dist,config,logger):
+class GravBody:
+    # One class for every body. The old GravApop/GravEarth/GravMoon/GravSun
+    # were four copies of the same code differing only in the body name,
+    # so the name is a parameter now.
+    def __init__(self, name, gConst, mass, dist, config, logger):
+        self.name = name
         self.config = config
         self.logger = logger
         self.gConst = gConst
         self.mass = mass
         self.dist = dist
-        self.gApop = None
+        self.grav = None
+
     def getGrav(self):
-        self.gApop = (self.gConst * self.mass)/(self.dist)
-        self.logger.info(f"Gravitational Force Of Apophis Calculated At: {self.gApop}")
+        self.grav = (self.gConst * self.mass)/(self.dist)
+        self.logger.info(f"Gravitational Force Of {self.name} Calculated At: {self.grav}")
+
     def printVal(self):
         print("Gravitational Constant (G): ", self.gConst)
         print("Mass: ", self.mass)
         print("Radius Squared: ", self.dist)
-        print("The Apophis asteroid has a gravitational influence of:\n", self.gApop, "m/s^2")
-class GravEarth:
-
-    def __init__(self,gConst,mass,dist,config,logger):
-      self.config = config
-      self.logger = logger
-      self.gConst = gConst
-      self.mass = mass
-      self.dist = dist
-      self.gEarth = None
-    def getGrav(self):
-      self.gEarth = (self.gConst * self.mass)/(self.dist)
-      self.logger.info(f"Gravitational Force Of Earth Calculated At: {self.gEarth}")
-    def printVal(self):
-      print("Gravitational Constant (G): ", self.gConst)
-      print("Mass: ", self.mass)
-      print("Radius Squared: ", self.dist)
-      print("The Earth has a gravitational influence of:\n", self.gEarth, "m/s^2")
-class GravMoon:
-
-    def __init__(self,gConst,mass,dist,config,logger):
-      self.config = config
-      self.logger = logger
-      self.gConst = gConst
-      self.mass = mass
-      self.dist = dist
-      self.gMoon = None
-    def getGrav(self):
-      self.gMoon = (self.gConst * self.mass)/(self.dist)
-      self.logger.info(f"Gravitational Force Of Moon Calculated At: {self.gMoon}")
-    def printVal(self):
-      print("Gravitational Constant (G): ", self.gConst)
-      print("Mass: ", self.mass)
-      print("Radius Squared: ", self.dist)
-      print("The Moon has a gravitational influence of:\n", self.gMoon, "m/s^2")
-class GravSun:
-
-    def __init__(self,gConst,mass,dist,config,logger):
-      self.config = config
-      self.logger = logger
-      self.gConst = gConst
-      self.mass = mass
-      self.dist = dist
-      self.gSun = None
-    def getGrav(self):
-      self.gSun = (self.gConst * self.mass)/(self.dist)
-      self.logger.info(f"Gravitational Force Of Sun Calculated At: {self.gSun}")
-    def printVal(self):
-      print("Gravitational Constant (G): ", self.gConst)
-      print("Mass: ", self.mass)
-      print("Radius Squared: ", self.dist)
-      print("The Sun has a gravitational influence of:\n", self.gSun, "m/s^2")
+        print(f"The {self.name} has a gravitational influence of:\n", self.grav, "m/s^2")
+
+
+# Thin subclasses keep the old class names (and result attributes) working.
+class GravApop(GravBody):
+    def __init__(self, gConst, mass, dist, config, logger):
+        super().__init__("Apophis asteroid", gConst, mass, dist, config, logger)
+
+    @property
+    def gApop(self):
+        return self.grav
+
+
+class GravEarth(GravBody):
+    def __init__(self, gConst, mass, dist, config, logger):
+        super().__init__("Earth", gConst, mass, dist, config, logger)
+
+    @property
+    def gEarth(self):
+        return self.grav
+
+
+class GravMoon(GravBody):
+    def __init__(self, gConst, mass, dist, config, logger):
+        super().__init__("Moon", gConst, mass, dist, config, logger)
+
+    @property
+    def gMoon(self):
+        return self.grav
+
+
+class GravSun(GravBody):
+    def __init__(self, gConst, mass, dist, config, logger):
+        super().__init__("Sun", gConst, mass, dist, config, logger)
 
+    @property
+    def gSun(self):
+        return self.grav
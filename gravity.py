@@ -1,28 +1,73 @@
 import numpy as np
 
+
+def _pairwise_accels_numpy(positions, masses, G):
+    # Broadcasting version of the pairwise kernel — used when numba
+    # isn't installed.
+    # r_ij[i, j] = position of body j minus position of body i
+    r_ij = positions[None, :, :] - positions[:, None, :]
+    d = np.linalg.norm(r_ij, axis=2)  # (N, N) scalar distances
+
+    # 1/d^3 for every pair. The diagonal (i == j) and any coincident
+    # bodies have d == 0 — those pairs contribute nothing.
+    d_safe = np.where(d == 0.0, 1.0, d)
+    inv_d3 = np.where(d == 0.0, 0.0, d_safe ** -3)
+
+    # a_i = G * SUM_j (m_j / d^3) * r_ij — one sum over the j axis.
+    return G * np.sum((masses[None, :] * inv_d3)[:, :, None] * r_ij, axis=1)
+
+
+def _pairwise_accels_loops(positions, masses, G):
+    # Explicit-loop version of the same math. On its own this is slow
+    # Python, but it's the shape numba compiles best: one fused native
+    # pass over the pairs with no temporary (N,N,3) arrays.
+    N = positions.shape[0]
+    acc = np.zeros((N, 3))
+    for i in range(N):
+        for j in range(N):
+            if i == j:
+                continue
+            rx = positions[j, 0] - positions[i, 0]
+            ry = positions[j, 1] - positions[i, 1]
+            rz = positions[j, 2] - positions[i, 2]
+            d = (rx * rx + ry * ry + rz * rz) ** 0.5
+            if d == 0.0:
+                continue
+            s = G * masses[j] / (d * d * d)
+            acc[i, 0] += s * rx
+            acc[i, 1] += s * ry
+            acc[i, 2] += s * rz
+    return acc
+
+
+try:
+    # numba is optional — if it's available, JIT-compile the loop kernel;
+    # otherwise the NumPy broadcasting version does the same job.
+    from numba import njit
+    _pairwise_accels = njit(cache=True)(_pairwise_accels_loops)
+except ImportError:
+    _pairwise_accels = _pairwise_accels_numpy
+
+
 class GravityCalc:
     G = 6.674e-11
 
     def compute_accelerations(self, bodies):
         # acceleration done by: a_i = G(SUM(j!=i)(m_j/[r_ij]^3)r_ij)
-        accelerations = []  # Initializing an acceleration Collection List?
-
-        for i, body_i in enumerate(bodies):  # enumerate gives index AND value
-            a = np.zeros(3)  # numpy zero vector for this body
-            for j, body_j in enumerate(bodies):
-                if i == j:
-                    continue
-                r_ij = body_j.position - body_i.position
-                d = np.linalg.norm(r_ij)  # Pythagorean theorem(scalar distance)
-                if d == 0:
-                    continue
-                a += self.G * (body_j.mass/d**3) * r_ij
+        # The pair math lives in the module-level kernel so numba can
+        # compile it when available (see _pairwise_accels above).
+        positions = np.array([body.position for body in bodies])  # (N, 3)
+        masses = np.array([body.mass for body in bodies])  # (N,)
+
+        acc = _pairwise_accels(positions, masses, self.G)  # (N, 3)
 
+        accelerations = []  # keep returning a list of per-body vectors
+        for i, body in enumerate(bodies):
+            a = acc[i]
             # rocket drone addition to the total forces
-            if hasattr(body_i, 'thrust_vector'):
-                a += body_i.thrust_vector / body_i.mass  # F=ma → a=F/m
-            # (Adds a single item to the end of an existing list)
-            accelerations.append(a)      # store this body's total acceleration
+            if hasattr(body, 'thrust_vector'):
+                a = a + body.thrust_vector / body.mass  # F=ma → a=F/m
+            accelerations.append(a)
         return accelerations
 
         """
@@ -85,17 +130,23 @@ class GravityCalc:
         KE = sum(body.kinetic_energy for body in bodies)
         # Calls the KE from before that has been added to the bodies already.
 
-        PE = 0.0
-        # range(len(bodies)) gives index numbers i and j for the number of bodies.
-        for i in range(len(bodies)):
-            for j in range(i + 1, len(bodies)):  # i+1 avoids double counting
-                r_ij = bodies[j].position - bodies[i].position
-                d = np.linalg.norm(r_ij) # Changes r_ij to a scalar distance, not a vector.
-
-                if d == 0.0:
-                    print(f"Error: zero distance between {bodies[i].name} and {bodies[j].name}")
-                    continue  # skip this pair, don't divide
-
-                PE += -self.G*bodies[i].mass*bodies[j].mass/d  # -G*mi*mj / distance
-                # This is accumulating the PE of each body "+="
+        # PE over every unique pair at once — triu_indices gives the
+        # (i, j) index pairs with j > i, so no double counting.
+        positions = np.array([body.position for body in bodies])
+        masses = np.array([body.mass for body in bodies])
+        i_idx, j_idx = np.triu_indices(len(bodies), k=1)
+
+        r_ij = positions[j_idx] - positions[i_idx]
+        d = np.linalg.norm(r_ij, axis=1)  # scalar distance per pair
+
+        # Zero-distance pairs are skipped (don't divide), same as before.
+        zero = d == 0.0
+        for i, j in zip(i_idx[zero], j_idx[zero]):
+            print(f"Error: zero distance between {bodies[i].name} and {bodies[j].name}")
+
+        d_safe = np.where(zero, 1.0, d)
+        # -G*mi*mj / distance, summed over every valid pair in one pass
+        PE = np.sum(np.where(
+            zero, 0.0, -self.G * masses[i_idx] * masses[j_idx] / d_safe
+        ))
         return KE + PE
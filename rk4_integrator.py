@@ -20,8 +20,17 @@ class RK4Integrator:
         # k4: is the derivative at a full step forward using k3
         k4 = derivative_func(t + dt, state + dt * k3)
 
-        # weighted average of all four trial states
-        new_state = state + (dt/6) * (k1 + 2*k2 + 2*k3 + k4)
+        # weighted average of all four trial states:
+        # new_state = state + (dt/6) * (k1 + 2*k2 + 2*k3 + k4)
+        # Accumulated in place — derivative_func returns a fresh array
+        # every call, so k1/k2 can be reused as scratch instead of
+        # allocating a temporary for each +/* in the one-liner above.
+        k2 += k3
+        k2 *= 2.0
+        k1 += k4
+        k1 += k2          # k1 now holds k1 + 2*k2 + 2*k3 + k4
+        k1 *= dt / 6
+        new_state = state + k1
         return new_state
 
     def integrate(self, bodies, t_total, dt, gravity, state_vector, sim_data):
@@ -12,6 +12,11 @@ class SimulationData:
 
         self.positions = {body.name: [] for body in bodies}
         self.velocities = {body.name: [] for body in bodies}
+
+        # Trajectories converted to numpy arrays, cached per body name.
+        # The visualizer asks for the same trajectory several times per
+        # frame — no need to rebuild the array from the list each time.
+        self._trajectory_cache = {}
         # Empty lists per body name.
         # dictionary comprehension: Short hand for below.
         # self.positions = {}
@@ -22,6 +27,9 @@ class SimulationData:
         self.times.append(t)
         self.energies.append(energy)
 
+        # New data — any cached trajectory arrays are now stale.
+        self._trajectory_cache.clear()
+
         for body in bodies:
             # Appends current state to all containers
             # (Adds a single item to the end of an existing list)
@@ -32,7 +40,13 @@ class SimulationData:
     def get_trajectory(self, body_name):
         # Grab the list of positions for one body by name, then convert to numpy array.
         # "Trajectory" is the new numpy array.
-        trajectory = np.array(self.positions[body_name])
+        # Converted once per body and reused — store_step clears the
+        # cache, so after the simulation finishes every later call is a
+        # dictionary lookup instead of an O(steps) list conversion.
+        trajectory = self._trajectory_cache.get(body_name)
+        if trajectory is None:
+            trajectory = np.array(self.positions[body_name])
+            self._trajectory_cache[body_name] = trajectory
         return trajectory
 
     def get_snapshot(self, index):
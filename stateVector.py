@@ -3,12 +3,14 @@ import numpy as np
 class StateVector:
 
     def pack(self, bodies):
-        N = len(bodies)
-
-        # Packs positions and velocities into flat array and concat joins them end to end.
-        positions = np.concatenate([body.position for body in bodies])
-        velocities = np.concatenate([body.velocity for body in bodies])
-        state = np.concatenate([positions, velocities])
+        # Packs positions and velocities into one flat array.
+        # Single concatenate call — all positions first, then all velocities.
+        # (The old version concatenated positions and velocities separately
+        # and then concatenated those two, copying everything twice.)
+        state = np.concatenate(
+            [body.position for body in bodies]
+            + [body.velocity for body in bodies]
+        )
         # Returning "state" numpy array
         return state
 
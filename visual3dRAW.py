@@ -200,9 +200,10 @@ class Visual3D:
 
     def draw_sphere(self, radius, slices=20, stacks=20):
         """Draw a sphere using GLU"""
-        quad = gluNewQuadric()
-        gluSphere(quad, radius, slices, stacks)
-        gluDeleteQuadric(quad)
+        # Reuse one quadric instead of creating/deleting one per call
+        if not hasattr(self, '_sphere_quadric'):
+            self._sphere_quadric = gluNewQuadric()
+        gluSphere(self._sphere_quadric, radius, slices, stacks)
 
     def draw_sun(self):
         """Draw the Sun at origin"""
@@ -14,6 +14,11 @@ class Visualizer:
         "Rocket":  (0.0, 1.0, 0.0),
     }
 
+    # Cap on points drawn per trail/orbit line each frame. Longer
+    # simulations get a coarser stride rather than more vertices, so
+    # draw cost stays bounded no matter how many steps were stored.
+    MAX_TRAIL_POINTS = 2000
+
     # not physically accurate but readable
     SIZES = {
         "Sun": 12,
@@ -23,11 +28,15 @@ class Visualizer:
         "Rocket": 2,
     }
 
-    def __init__(self, sim_data):
+    def __init__(self, sim_data, seed=42):
         self.sim_data = sim_data
         # pygame initialization
         pygame.init()
 
+        # One Generator per instance — never touches numpy's global RNG
+        # state, and a fixed seed keeps the star field reproducible.
+        self._rng = np.random.default_rng(seed)
+
         self.camera_target = 'solar'
 
         # window (Width, Height).
@@ -70,6 +79,25 @@ class Visualizer:
             (self.width, self.height), pygame.SRCALPHA
         )
 
+        # 0-255 versions of COLORS, converted once here instead of per
+        # body per frame inside draw_orbits/draw_bodies
+        self.colors_255 = {
+            name: tuple(int(c * 255) for c in color)
+            for name, color in self.COLORS.items()
+        }
+
+        # HUD texture handle — allocated on first blit, then reused and
+        # updated in place every frame instead of create/delete per frame
+        self.hud_texture = None
+
+        # Shared GLU quadric for _draw_sphere, created on first use
+        self._sphere_quadric = None
+
+        # Cache of trajectories already converted to GL units.
+        # The simulation is finished before the visualizer runs, so each
+        # body's trajectory only needs converting once — not every frame.
+        self._gl_trajectories = {}
+
         # Call OpenGL one-time setup at end of __init__
         self._init_opengl()
 
@@ -115,19 +143,23 @@ class Visualizer:
         Display lists are compiled once and replayed cheaply each frame.
         Stars are placed on a large sphere around the origin.
         """
-        rng = np.random.default_rng(42)  # fixed seed — stars don't shuffle each frame
+        rng = self._rng  # per-instance Generator created in __init__
 
         # Random spherical coordinates converted to Cartesian
         theta = rng.uniform(0, 2 * np.pi, count)
         phi = rng.uniform(0, np.pi, count)
         radius = 500.0
 
-        xs = radius * np.sin(phi) * np.cos(theta)
-        ys = radius * np.sin(phi) * np.sin(theta)
-        zs = radius * np.cos(phi)
+        # sin(phi) is shared by xs and ys — compute it once
+        sin_phi = np.sin(phi)
+
+        # float32 — single precision is all glVertex3f/glColor3f consume
+        xs = (radius * sin_phi * np.cos(theta)).astype(np.float32)
+        ys = (radius * sin_phi * np.sin(theta)).astype(np.float32)
+        zs = (radius * np.cos(phi)).astype(np.float32)
 
         # Random brightness for each star (0.3 – 1.0)
-        brightness = rng.uniform(0.3, 1.0, count)
+        brightness = rng.uniform(0.3, 1.0, count).astype(np.float32)
 
         # Compile into display list
         star_list = glGenLists(1)
@@ -193,9 +225,7 @@ class Visualizer:
         if body_name is None:
             return None  # solar — no offset needed
 
-        traj = self.sim_data.get_trajectory(body_name)
-        pos = traj[self.frame_index]  # metres
-        return self._world_to_gl(pos)  # convert to GL units
+        return self._get_gl_trajectory(body_name)[self.frame_index]
 
     def _world_to_gl(self, position):
         """
@@ -206,6 +236,22 @@ class Visualizer:
         AU = 1.496e11  # metres per astronomical unit
         return np.array(position, dtype=float) / AU
 
+    def _get_gl_trajectory(self, name):
+        """
+        Returns a body's full trajectory converted to GL units,
+        converting it on first request and reusing the cached array on
+        every frame after that.
+        """
+        traj = self._gl_trajectories.get(name)
+        if traj is None:
+            AU = 1.496e11  # metres per astronomical unit
+            traj = np.asarray(self.sim_data.get_trajectory(name), dtype=float) / AU
+            # float32 is plenty for display — glVertex3f takes single
+            # precision anyway, and half the bytes means half the memory
+            # traffic per frame
+            self._gl_trajectories[name] = traj.astype(np.float32)
+        return self._gl_trajectories[name]
+
     def draw_3d_scene(self):
         """
         Renders all celestial bodies and their orbital trails in 3D OpenGL.
@@ -220,13 +266,15 @@ class Visualizer:
 
         # --- Each body ---
         for name, color in self.COLORS.items():
-            traj = self.sim_data.get_trajectory(name)
-
-            # Convert positions to GL units
-            gl_positions = np.array([self._world_to_gl(p) for p in traj])
+            # Positions in GL units — converted once, cached across frames
+            gl_positions = self._get_gl_trajectory(name)
 
             # -- Orbital trail (up to current frame, 40% opacity) --
-            trail = gl_positions[:self.frame_index]
+            # Stride keeps the vertex count bounded at MAX_TRAIL_POINTS.
+            # Ceiling division — floor would undershoot the stride and
+            # let the vertex count grow to nearly 2x the cap.
+            step = max(1, -(-self.frame_index // self.MAX_TRAIL_POINTS))
+            trail = gl_positions[:self.frame_index:step]
             if len(trail) >= 2:
                 glLineWidth(1.0)
                 glBegin(GL_LINE_STRIP)
@@ -259,10 +307,12 @@ class Visualizer:
         """
         glPushMatrix()
         glTranslatef(position[0], position[1], position[2])
-        quad = gluNewQuadric()
-        gluQuadricNormals(quad, GLU_SMOOTH)
-        gluSphere(quad, radius, 16, 16)  # 16 slices × 16 stacks
-        gluDeleteQuadric(quad)
+        # One quadric for the lifetime of the visualizer — allocated on
+        # first use instead of new/delete per sphere per frame
+        if self._sphere_quadric is None:
+            self._sphere_quadric = gluNewQuadric()
+            gluQuadricNormals(self._sphere_quadric, GLU_SMOOTH)
+        gluSphere(self._sphere_quadric, radius, 16, 16)  # 16 slices × 16 stacks
         glPopMatrix()
 
     def _draw_grid(self):
@@ -331,18 +381,32 @@ class Visualizer:
           2. Upload that surface as an OpenGL texture
           3. Draw the texture as a screen-aligned quad in front of everything
         """
-        # Convert pygame surface pixels to a byte string OpenGL can upload
-        raw = pygame.image.tostring(self.hud_surface, 'RGBA', True)
-        tex = glGenTextures(1)
-
-        glBindTexture(GL_TEXTURE_2D, tex)
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
-        glTexImage2D(
-            GL_TEXTURE_2D, 0, GL_RGBA,
-            self.width, self.height, 0,
-            GL_RGBA, GL_UNSIGNED_BYTE, raw
-        )
+        # Convert pygame surface pixels to a byte string OpenGL can upload.
+        # No flipped=True — that made pygame reverse all rows of the
+        # 1200x800 surface every frame. The quad below flips its texture
+        # coordinates instead, which costs nothing.
+        raw = pygame.image.tostring(self.hud_surface, 'RGBA')
+
+        if self.hud_texture is None:
+            # First frame — allocate the texture and its storage once
+            self.hud_texture = glGenTextures(1)
+            glBindTexture(GL_TEXTURE_2D, self.hud_texture)
+            glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
+            glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
+            glTexImage2D(
+                GL_TEXTURE_2D, 0, GL_RGBA,
+                self.width, self.height, 0,
+                GL_RGBA, GL_UNSIGNED_BYTE, raw
+            )
+        else:
+            # Every later frame — rewrite the pixels of the existing
+            # texture; no allocation, no delete
+            glBindTexture(GL_TEXTURE_2D, self.hud_texture)
+            glTexSubImage2D(
+                GL_TEXTURE_2D, 0, 0, 0,
+                self.width, self.height,
+                GL_RGBA, GL_UNSIGNED_BYTE, raw
+            )
 
         # Switch to orthographic (2D) projection to draw the overlay quad
         glMatrixMode(GL_PROJECTION)
@@ -358,14 +422,16 @@ class Visualizer:
         glDisable(GL_DEPTH_TEST)
 
         glColor4f(1.0, 1.0, 1.0, 1.0)
+        # t coordinates inverted — pygame rows are top-down while GL's
+        # origin is bottom-left, so the flip happens here for free
         glBegin(GL_QUADS)
-        glTexCoord2f(0, 0);
+        glTexCoord2f(0, 1);
         glVertex2f(0, 0)
-        glTexCoord2f(1, 0);
-        glVertex2f(self.width, 0)
         glTexCoord2f(1, 1);
+        glVertex2f(self.width, 0)
+        glTexCoord2f(1, 0);
         glVertex2f(self.width, self.height)
-        glTexCoord2f(0, 1);
+        glTexCoord2f(0, 0);
         glVertex2f(0, self.height)
         glEnd()
 
@@ -378,9 +444,6 @@ class Visualizer:
         glMatrixMode(GL_MODELVIEW)
         glPopMatrix()
 
-        # Clean up texture (created fresh each frame — simple but correct)
-        glDeleteTextures([tex])
-
 # ////////////////////////////////////////////////////////////////////////////////////////////
 # ////////////////////////////////////////////////////////////////////////////////////////////
 # --------------------— OpenGL setup and 3D rendering  (built by Claude)---------------------------
@@ -506,14 +569,18 @@ class Visualizer:
             # get_trajectory returns a numpy array of shape (n_steps, 3).
             trajectory = self.sim_data.get_trajectory(name)
 
-            # converting color from 0-1 to 0-255.
-            color_255 = tuple(int(c * 255) for c in color)
+            # color in 0-255, looked up from the precomputed table.
+            color_255 = self.colors_255[name]
 
             # gets the positions from trajectory.
             # slice first, then convert each position individually
             # The list comprehension loops through each position
             # -> up to frame_index and converts it to screen coordinates.
-            points = [self.world_to_screen(pos) for pos in trajectory[:self.frame_index]]
+            # Strided so long runs don't convert/draw thousands of points
+            # every frame — MAX_TRAIL_POINTS bounds the work. Ceiling
+            # division, so the bound actually holds.
+            step = max(1, -(-self.frame_index // self.MAX_TRAIL_POINTS))
+            points = [self.world_to_screen(pos) for pos in trajectory[:self.frame_index:step]]
             # Short version of above:
             # points = []
             # for pos in trajectory[:self.frame_index]:
@@ -533,8 +600,7 @@ class Visualizer:
             current_pos = trajectory[self.frame_index]
 
             # one SINGLE position to screen coordinates(points logic above gets a list)
-            # make these local variable again.
-            color_255 = tuple(int(c * 255) for c in color)
+            color_255 = self.colors_255[name]
             screen_x, screen_y = self.world_to_screen(current_pos)
             # surface,    # self.screen
             # color,      # RGB tuple 0-255